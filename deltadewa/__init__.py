@@ -2,7 +2,9 @@
 
 __version__ = "0.1.0"
 
+from ._bs_vec import portfolio_greeks, price_chain
 from .american_option import AmericanOption
+from .market_data import MarketDataPool
 from .portfolio import OptionPortfolio
 
-__all__ = ["AmericanOption", "OptionPortfolio"]
+__all__ = ["AmericanOption", "MarketDataPool", "OptionPortfolio", "portfolio_greeks", "price_chain"]
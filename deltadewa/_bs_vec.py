@@ -0,0 +1,294 @@
+"""Vectorized Bjerksund-Stensland American option pricing on NumPy arrays.
+
+This reproduces ``ql.BjerksundStenslandApproximationEngine`` (the flat exercise
+boundary of Bjerksund & Stensland, 1993) but evaluates a whole option chain
+(arrays of strikes, spots, vols, ...) in a single pass, avoiding one QuantLib
+object graph per instrument.
+"""
+
+import numpy as np
+
+# Numerical differentiation parameters (same conventions as AmericanOption)
+_SPOT_BUMP = 0.01
+_VOL_BUMP = 0.01
+_RATE_BUMP = 0.01
+_DAY = 1.0 / 365.0
+
+# Bump direction of each input in the scenarios priced by bjerksund_stensland_greeks
+_SPOT_SCENARIOS = np.array([0.0, 1.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+_VOL_SCENARIOS = np.array([0.0, 0.0, 0.0, 1.0, -1.0, 0.0, 0.0, 0.0, 0.0])
+_RATE_SCENARIOS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 1.0, -1.0, 0.0, 0.0])
+_LATER_SCENARIOS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0])
+_EARLIER_SCENARIOS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+
+# Scenarios each measure is differenced from
+_MEASURE_SCENARIOS = {
+    "price": (0,),
+    "delta": (1, 2),
+    "gamma": (0, 1, 2),
+    "vega": (3, 4),
+    "theta": (7, 8),
+    "rho": (5, 6),
+}
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (Hart's double precision algorithm, as given by West 2005)."""
+    x = np.asarray(x)
+    if x.dtype.kind != "f":
+        x = x.astype(float)
+    a = np.abs(x).reshape(-1)
+    e = np.exp(-0.5 * a * a)
+
+    # Horner steps in place: the kernel calls this ten times per pricing pass
+    num = 3.52624965998911e-02 * a + 0.700383064443688
+    for coeff in (
+        6.37396220353165,
+        33.912866078383,
+        112.079291497871,
+        221.213596169931,
+        220.206867912376,
+    ):
+        num *= a
+        num += coeff
+    den = 8.83883476483184e-02 * a + 1.75566716318264
+    for coeff in (
+        16.064177579207,
+        86.7807322029461,
+        296.564248779674,
+        637.333633378831,
+        793.826512519948,
+        440.413735824752,
+    ):
+        den *= a
+        den += coeff
+    tail = e * num
+    tail /= den
+
+    # The continued fraction is only needed in the far tails, usually a few points
+    far = a >= 7.07106781186547
+    if far.any():
+        a_far = a[far]
+        frac = a_far + 0.65
+        frac = a_far + 4.0 / frac
+        frac = a_far + 3.0 / frac
+        frac = a_far + 2.0 / frac
+        frac = a_far + 1.0 / frac
+        tail[far] = np.where(a_far > 37.0, 0.0, e[far] / frac / 2.506628274631)
+    tail = tail.reshape(x.shape)
+    return np.where(x > 0.0, 1.0 - tail, tail)
+
+
+def _phi(S, T, gamma, H, trigger, r, b, v):
+    """Bjerksund-Stensland phi function, without the leading S**gamma factor."""
+    v2 = v * v
+    v_sqrt_t = v * np.sqrt(T)
+    lam = (-r + gamma * b + 0.5 * gamma * (gamma - 1.0) * v2) * T
+    d = -(np.log(S / H) + (b + (gamma - 0.5) * v2) * T) / v_sqrt_t
+    kappa = 2.0 * b / v2 + 2.0 * gamma - 1.0
+    return np.exp(lam) * (
+        _norm_cdf(d) - (trigger / S) ** kappa * _norm_cdf(d - 2.0 * np.log(trigger / S) / v_sqrt_t)
+    )
+
+
+def _american_call(S, K, T, r, b, v):
+    """Bjerksund-Stensland American call with cost of carry b = r - q."""
+    sqrt_t = np.sqrt(T)
+    d1 = (np.log(S / K) + (b + 0.5 * v * v) * T) / (v * sqrt_t)
+    d2 = d1 - v * sqrt_t
+    european = S * np.exp((b - r) * T) * _norm_cdf(d1) - K * np.exp(-r * T) * _norm_cdf(d2)
+
+    # Never optimal to exercise early when the dividend yield is at most zero
+    # and at most the rate (b >= r and b >= 0; for puts, r <= 0 and r <= q):
+    # those are European, as in QuantLib, and the early exercise approximation
+    # is only evaluated for the rest
+    early = np.broadcast_to((b < r) | (b < 0.0), european.shape)
+    if not early.any():
+        return european
+    if early.all():
+        american = _early_exercise_call(S, K, T, r, b, v)
+        # Floored at the European value, as QuantLib does. fmax also falls back
+        # to it where the flat boundary has no real solution (NaN), which
+        # happens at negative rates
+        return np.fmax(american, european)
+    S, K, T, r, b, v = (np.broadcast_to(x, early.shape)[early] for x in (S, K, T, r, b, v))
+    price = european.copy()
+    price[early] = np.fmax(_early_exercise_call(S, K, T, r, b, v), european[early])
+    return price
+
+
+def _early_exercise_call(S, K, T, r, b, v):
+    """Bjerksund-Stensland flat-boundary approximation of a call with b < r or b < 0."""
+    sqrt_t = np.sqrt(T)
+    v2 = v * v
+    beta = (0.5 - b / v2) + np.sqrt((b / v2 - 0.5) ** 2 + 2.0 * r / v2)
+    b_inf = beta / (beta - 1.0) * K
+    b_0 = np.maximum(K, r / (r - b) * K)
+    h = -(b * T + 2.0 * v * sqrt_t) * b_0 / (b_inf - b_0)
+    trigger = b_0 + (b_inf - b_0) * (1.0 - np.exp(h))
+
+    # alpha * S**beta written as (I - K) * (S / I)**beta to avoid overflow
+    alpha = (trigger - K) * (S / trigger) ** beta
+
+    american = (
+        alpha
+        - alpha * _phi(S, T, beta, trigger, trigger, r, b, v)
+        + S * _phi(S, T, 1.0, trigger, trigger, r, b, v)
+        - S * _phi(S, T, 1.0, K, trigger, r, b, v)
+        - K * _phi(S, T, 0.0, trigger, trigger, r, b, v)
+        + K * _phi(S, T, 0.0, K, trigger, r, b, v)
+    )
+    # Immediate exercise at or above the trigger
+    return np.where(trigger <= S, S - K, american)
+
+
+def bjerksund_stensland_price(S, K, T, r, q, sigma, is_call, dtype=np.float64) -> np.ndarray:
+    """
+    Price American options with the Bjerksund-Stensland approximation.
+
+    All arguments broadcast against each other.
+
+    Args:
+        S: Spot price(s) of the underlying
+        K: Strike price(s)
+        T: Time(s) to maturity in years
+        r: Risk-free rate(s) (annualized)
+        q: Dividend yield(s) (annualized)
+        sigma: Volatility(ies) (annualized)
+        is_call: Boolean flag(s), True for calls and False for puts
+        dtype: Floating point type to compute in. np.float32 runs ~2.5x faster
+            and stays within ~1e-4 of the float64 price, enough for display
+            sweeps; it is too coarse for bump-and-reprice Greeks
+
+    Returns:
+        Array of option prices
+    """
+    S, K, T, r, q, sigma, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=dtype) for x in (S, K, T, r, q, sigma)),
+        np.asarray(is_call, dtype=bool),
+    )
+    intrinsic = np.maximum(np.where(is_call, S - K, K - S), 0.0)
+    live = T > 0.0
+
+    # Put-call transformation: P(S, K, T, r, q) = C(K, S, T, q, r)
+    spot = np.where(is_call, S, K)
+    strike = np.where(is_call, K, S)
+    rate = np.where(is_call, r, q)
+    carry = np.where(is_call, r - q, q - r)
+
+    with np.errstate(all="ignore"):
+        price = _american_call(spot, strike, np.where(live, T, 1.0), rate, carry, sigma)
+    return np.where(live, np.maximum(price, intrinsic), intrinsic)
+
+
+def bjerksund_stensland_greeks(S, K, T, r, q, sigma, is_call, measures=None) -> dict:
+    """
+    Price and Greeks from a single kernel evaluation.
+
+    The base point and every bump scenario (spot +/-, vol +/-, rate +/-, one day
+    later and earlier) are stacked along a new leading axis and priced in one call, so the
+    broadcasting, put-call transformation and boundary constants are computed
+    once for all of them. Greeks follow ``AmericanOption``'s units: vega and rho
+    per 1% change, theta per calendar day. Only the scenarios behind the
+    requested measures are priced.
+
+    Args:
+        S: Spot price(s) of the underlying
+        K: Strike price(s)
+        T: Time(s) to maturity in years
+        r: Risk-free rate(s) (annualized)
+        q: Dividend yield(s) (annualized)
+        sigma: Volatility(ies) (annualized)
+        is_call: Boolean flag(s), True for calls and False for puts
+        measures: Names of the measures to return (default: all six)
+
+    Returns:
+        Dict of arrays keyed by the requested measures out of 'price', 'delta',
+        'gamma', 'vega', 'theta', 'rho'
+    """
+    if measures is None:
+        measures = tuple(_MEASURE_SCENARIOS)
+    S, K, T, r, q, sigma, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, T, r, q, sigma)),
+        np.asarray(is_call, dtype=bool),
+    )
+    # Scenarios along the leading axis: base, spot +/-, vol +/-, rate +/-, one day
+    # later and earlier (the later one stops at expiry), keeping only those needed
+    rows = sorted({row for name in measures for row in _MEASURE_SCENARIOS[name]})
+    axis = (-1,) + (1,) * S.ndim
+    spot_shift = (_SPOT_SCENARIOS[rows] * _SPOT_BUMP).reshape(axis)
+    vol_shift = (_VOL_SCENARIOS[rows] * _VOL_BUMP).reshape(axis)
+    rate_shift = (_RATE_SCENARIOS[rows] * _RATE_BUMP).reshape(axis)
+    step_forward = np.minimum(_DAY, T)
+    time_shift = _LATER_SCENARIOS[rows].reshape(axis) * step_forward
+    time_shift = time_shift - (_EARLIER_SCENARIOS[rows] * _DAY).reshape(axis)
+
+    priced = bjerksund_stensland_price(
+        S + spot_shift, K, T - time_shift, r + rate_shift, q, sigma + vol_shift, is_call
+    )
+    p = dict(zip(rows, priced))
+    formulas = {
+        "price": lambda: p[0],
+        "delta": lambda: (p[1] - p[2]) / (2 * _SPOT_BUMP),
+        "gamma": lambda: (p[1] - 2 * p[0] + p[2]) / _SPOT_BUMP**2,
+        "vega": lambda: (p[3] - p[4]) / 2.0,
+        "theta": lambda: (p[7] - p[8]) * _DAY / (step_forward + _DAY),
+        "rho": lambda: (p[5] - p[6]) / 2.0,
+    }
+    return {name: formulas[name]() for name in measures}
+
+
+def price_chain(spot, strikes, T, r, q, sigma, option_type: str = "call") -> dict:
+    """
+    Price an option chain and its Greeks in one vectorized pass.
+
+    Greeks follow the same units as ``AmericanOption``: vega and rho per 1%
+    change, theta per calendar day.
+
+    Args:
+        spot: Spot price of the underlying (scalar or array)
+        strikes: Strike prices (scalar or array)
+        T: Time(s) to maturity in years
+        r: Risk-free rate (annualized)
+        q: Dividend yield (annualized)
+        sigma: Volatility or array of volatilities (annualized)
+        option_type: "call" or "put"
+
+    Returns:
+        Dict of arrays keyed by 'price', 'delta', 'gamma', 'vega', 'theta', 'rho'
+    """
+    option_type = option_type.lower()
+    if option_type not in ("call", "put"):
+        raise ValueError(f"Invalid option type: {option_type}")
+    return bjerksund_stensland_greeks(spot, strikes, T, r, q, sigma, option_type == "call")
+
+
+def portfolio_greeks(S, K, T, r, q, sigma, is_call, scale, measures=None) -> dict:
+    """
+    Position-weighted price and Greeks of a book under any shape of markets.
+
+    Positions run along the last axis and are summed out, weighted by
+    ``scale``; the leading axes are free, so a stress matrix of spots and
+    vols is priced in one call, e.g. ``S=spots[:, None, None]`` and
+    ``sigma=vols[None, :, None]`` against 1-D position arrays give
+    (spots, vols) totals. Units follow ``price_chain``.
+
+    Args:
+        S: Spot price(s) of the underlying
+        K: Strike price(s)
+        T: Time(s) to maturity in years
+        r: Risk-free rate(s) (annualized)
+        q: Dividend yield(s) (annualized)
+        sigma: Volatility(ies) (annualized)
+        is_call: Boolean flag(s), True for calls and False for puts
+        scale: Shares held per position (quantity * contract size)
+        measures: Names of the measures to return (default: all six)
+
+    Returns:
+        Dict of total arrays, shaped like the market axes, keyed by the
+        requested measures out of 'price', 'delta', 'gamma', 'vega', 'theta',
+        'rho'
+    """
+    greeks = bjerksund_stensland_greeks(S, K, T, r, q, sigma, is_call, measures)
+    scale = np.asarray(scale, dtype=float)
+    return {name: values @ scale for name, values in greeks.items()}
@@ -0,0 +1,53 @@
+"""Optional on-disk memoization of option prices across sessions."""
+
+import atexit
+import shelve
+from typing import Optional
+
+# The shelf stays open while the cache is enabled: opening it costs more than
+# a QuantLib approximation-engine price, so a per-lookup open would make hits
+# slower than misses. It is closed (and flushed) by disable() and at exit.
+_shelf: Optional[shelve.Shelf] = None
+
+
+def enable(path: str = ".dd_cache") -> None:
+    """Open (or create) the persistent cache at ``path``."""
+    global _shelf
+    disable()
+    _shelf = shelve.DbfilenameShelf(path)
+
+
+def disable() -> None:
+    """Close the persistent cache; prices are no longer stored on disk."""
+    global _shelf
+    if _shelf is not None:
+        _shelf.close()
+        _shelf = None
+
+
+def is_enabled() -> bool:
+    """Whether a persistent cache is currently open."""
+    return _shelf is not None
+
+
+def get(key: str) -> Optional[float]:
+    """Look up a cached price, or None when absent or caching is disabled."""
+    if _shelf is None:
+        return None
+    return _shelf.get(key)
+
+
+def put(key: str, value: float) -> None:
+    """Store a price if caching is enabled."""
+    if _shelf is not None:
+        _shelf[key] = value
+
+
+def clear() -> None:
+    """Remove every stored price."""
+    if _shelf is not None:
+        _shelf.clear()
+        _shelf.sync()
+
+
+atexit.register(disable)
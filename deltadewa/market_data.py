@@ -0,0 +1,169 @@
+"""Shared QuantLib market data for options on the same underlying."""
+
+import weakref
+from typing import Optional
+
+import QuantLib as ql  # type: ignore
+
+# Stateless QuantLib conventions shared by every option's term structures
+_ACT365 = ql.Actual365Fixed()  # type: ignore
+_NULLCAL = ql.NullCalendar()  # type: ignore
+
+
+class _Curves:
+    """Rate, dividend and volatility quotes with their flat term structures."""
+
+    def __init__(
+        self,
+        valuation_date: ql.Date,
+        risk_free_rate: float,
+        dividend_yield: float,
+        volatility: float,
+    ):
+        """
+        Build the term structures, which do not depend on the spot price.
+
+        Args:
+            valuation_date: QuantLib reference date of the term structures
+            risk_free_rate: Risk-free interest rate (annualized)
+            dividend_yield: Dividend yield (annualized)
+            volatility: Implied volatility (annualized)
+        """
+        self.rate_quote = ql.SimpleQuote(float(risk_free_rate))
+        self.dividend_quote = ql.SimpleQuote(float(dividend_yield))
+        self.vol_quote = ql.SimpleQuote(float(volatility))
+
+        self.flat_ts = ql.YieldTermStructureHandle(
+            ql.FlatForward(valuation_date, ql.QuoteHandle(self.rate_quote), _ACT365)
+        )
+        self.dividend_ts = ql.YieldTermStructureHandle(
+            ql.FlatForward(valuation_date, ql.QuoteHandle(self.dividend_quote), _ACT365)
+        )
+        self.flat_vol_ts = ql.BlackVolTermStructureHandle(
+            ql.BlackConstantVol(valuation_date, _NULLCAL, ql.QuoteHandle(self.vol_quote), _ACT365)
+        )
+
+
+class MarketData:
+    """Quotes, flat term structures and Black-Scholes-Merton process for one set of inputs."""
+
+    def __init__(
+        self,
+        valuation_date: ql.Date,
+        spot_price: float,
+        risk_free_rate: float,
+        dividend_yield: float,
+        volatility: float,
+        curves: Optional[_Curves] = None,
+    ):
+        """
+        Build the QuantLib market data.
+
+        Args:
+            valuation_date: QuantLib reference date of the term structures
+            spot_price: Current price of the underlying asset
+            risk_free_rate: Risk-free interest rate (annualized)
+            dividend_yield: Dividend yield (annualized)
+            volatility: Implied volatility (annualized)
+            curves: Term structures for the same date, rates and volatility to
+                share instead of building new ones
+        """
+        # SimpleQuotes so updates are O(1) setValue() calls; the SWIG constructor
+        # rejects NumPy scalars, which scenario grids pass in
+        self.spot_quote = ql.SimpleQuote(float(spot_price))
+        if curves is None:
+            curves = _Curves(valuation_date, risk_free_rate, dividend_yield, volatility)
+        self._curves = curves
+        self.rate_quote = curves.rate_quote
+        self.dividend_quote = curves.dividend_quote
+        self.vol_quote = curves.vol_quote
+        self.flat_ts = curves.flat_ts
+        self.dividend_ts = curves.dividend_ts
+        self.flat_vol_ts = curves.flat_vol_ts
+
+        self.bsm_process = ql.BlackScholesMertonProcess(
+            ql.QuoteHandle(self.spot_quote), self.dividend_ts, self.flat_ts, self.flat_vol_ts
+        )
+        self._engines: dict = {}
+
+    def engine(self, engine: str, t_grid: int, x_grid: int) -> ql.PricingEngine:
+        """
+        Pricing engine on this process, shared by every option that uses it.
+
+        Args:
+            engine: "fd" for the finite-difference engine, otherwise Bjerksund-Stensland
+            t_grid: Time steps for the "fd" engine
+            x_grid: Price steps for the "fd" engine
+
+        Returns:
+            QuantLib pricing engine
+        """
+        key = (engine, t_grid, x_grid) if engine == "fd" else (engine,)
+        if key not in self._engines:
+            # Bjerksund-Stensland closed-form approximation by default: a handful of
+            # normal CDF evaluations per price instead of a full finite-difference grid
+            # solve. Greeks the engine does not expose fall back to bump-and-reprice.
+            if engine == "fd":
+                self._engines[key] = ql.FdBlackScholesVanillaEngine(
+                    self.bsm_process, t_grid, x_grid
+                )
+            else:
+                self._engines[key] = ql.BjerksundStenslandApproximationEngine(self.bsm_process)
+        return self._engines[key]
+
+
+class MarketDataPool:
+    """
+    Cache of MarketData shared by the options on one underlying.
+
+    An option chain priced off the same spot, rates and volatility then builds
+    its term structures, process and engine once instead of once per option.
+    Entries that differ only in spot share their term structures, so a spot
+    move builds just a quote, a process and an engine. Entries are held weakly
+    and disappear when no option uses them anymore.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._entries: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._curves: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def get_or_build(
+        self,
+        valuation_serial: int,
+        spot_price: float,
+        risk_free_rate: float,
+        dividend_yield: float,
+        volatility: float,
+    ) -> MarketData:
+        """
+        Return the market data for these inputs, building it on first use.
+
+        Args:
+            valuation_serial: QuantLib serial number of the valuation date
+            spot_price: Current price of the underlying asset
+            risk_free_rate: Risk-free interest rate (annualized)
+            dividend_yield: Dividend yield (annualized)
+            volatility: Implied volatility (annualized)
+
+        Returns:
+            Shared MarketData instance
+        """
+        key = (valuation_serial, spot_price, risk_free_rate, dividend_yield, volatility)
+        market = self._entries.get(key)
+        if market is None:
+            valuation_date = ql.Date(valuation_serial)
+            curves_key = (valuation_serial, risk_free_rate, dividend_yield, volatility)
+            curves = self._curves.get(curves_key)
+            if curves is None:
+                curves = _Curves(valuation_date, risk_free_rate, dividend_yield, volatility)
+                self._curves[curves_key] = curves
+            market = MarketData(
+                valuation_date, spot_price, risk_free_rate, dividend_yield, volatility, curves
+            )
+            self._entries[key] = market
+        return market
+
+    def __len__(self) -> int:
+        """Number of live entries."""
+        return len(self._entries)
@@ -0,0 +1,129 @@
+"""Tests for AmericanOption pricing at the edges of its inputs."""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from deltadewa import AmericanOption, OptionPortfolio
+
+_TODAY = datetime(2026, 10, 15)
+_EXPIRY = datetime(2027, 3, 19)
+_ONE_YEAR = datetime(2027, 10, 15)
+
+
+def _spot_at(d, strike, rate, dividend, vol, shift):
+    """Spot whose Black d1 (shift 0.5) or d2 (shift -0.5) over one year is d."""
+    return strike * math.exp(d * vol - (rate - dividend) - shift * vol * vol)
+
+
+def _perpetual_boundary(strike, rate, dividend, vol, is_call):
+    """Perpetual American exercise boundary (McDonald-Siegel)."""
+    rate, carry = (rate, rate - dividend) if is_call else (dividend, dividend - rate)
+    ratio = carry / vol**2 - 0.5
+    beta = -ratio + math.sqrt(ratio**2 + 2.0 * rate / vol**2)
+    factor = beta / (beta - 1.0)
+    return strike * factor if is_call else strike / factor
+
+
+_DEEP = AmericanOption._DEEP_MONEYNESS_STDEVS
+# (spot, rate, dividend, vol, option_type) just past each shortcut's threshold
+_PAST_THRESHOLD = [
+    # Out of the money, beyond -5 standard deviations of d1 (calls) or d2 (puts)
+    (_spot_at(-_DEEP - 0.01, 100.0, 0.05, 0.02, 0.3, 0.5), 0.05, 0.02, 0.3, "call"),
+    (_spot_at(-_DEEP - 0.01, 100.0, 0.05, 0.03, 1.5, 0.5), 0.05, 0.03, 1.5, "call"),
+    (_spot_at(_DEEP + 0.01, 100.0, 0.05, 0.02, 0.3, -0.5), 0.05, 0.02, 0.3, "put"),
+    # In the money and never exercised early: the forward value
+    (_spot_at(_DEEP + 0.01, 100.0, 0.05, 0.0, 0.1, -0.5), 0.05, 0.0, 0.1, "call"),
+    (_spot_at(-_DEEP - 0.01, 100.0, -0.01, 0.0, 0.1, 0.5), -0.01, 0.0, 0.1, "put"),
+    # Just past the perpetual exercise boundary: intrinsic
+    (_perpetual_boundary(100.0, 0.05, 0.03, 0.1, True) * 1.001, 0.05, 0.03, 0.1, "call"),
+    (_perpetual_boundary(100.0, 0.05, 0.02, 0.25, False) * 0.999, 0.05, 0.02, 0.25, "put"),
+]
+
+
+@pytest.mark.parametrize("engine", ["quantlib", "numpy", "fd"])
+def test_zero_spot_priced_at_its_bound(engine):
+    """A worthless underlying has no log-moneyness; calls are worth 0, puts the strike."""
+    greeks = {}
+    for option_type in ("call", "put"):
+        option = AmericanOption(
+            0.0, 95.0, _EXPIRY, 0.25, 0.05, 0.02, option_type, valuation_date=_TODAY, engine=engine
+        )
+        greeks[option_type] = option.greeks()
+
+    assert greeks["call"] == pytest.approx(dict.fromkeys(greeks["call"], 0.0))
+    assert greeks["put"]["price"] == pytest.approx(95.0)
+    assert greeks["put"]["delta"] == -1.0
+    assert all(np.isfinite(list(greeks["put"].values())))
+
+
+def _fd_portfolio():
+    portfolio = OptionPortfolio(0, 100.0, 0.25, 0.05, 0.02, valuation_date=_TODAY)
+    portfolio.add_position(95.0, _EXPIRY, 1, "put")
+    portfolio.add_position(105.0, _EXPIRY, -1, "call")
+    # The "fd" engine sends scenario_analysis() down the per-position loop
+    for position in portfolio.positions:
+        position.option.engine = "fd"
+        position.option._attach_market_data()
+    return portfolio
+
+
+def test_fd_scenario_analysis_reaches_zero_spot():
+    scenarios = _fd_portfolio().scenario_analysis(np.array([0.0, 50.0, 100.0]))
+    assert scenarios["portfolio_value"].iloc[0] == pytest.approx(9500.0)
+    assert np.isfinite(scenarios.drop(columns="spot_price").to_numpy()).all()
+
+
+def test_fd_scenario_analysis_restores_each_option_once(monkeypatch):
+    portfolio = _fd_portfolio()
+    before = [pos.option.price() for pos in portfolio.positions]
+
+    attaches = []
+    attach = AmericanOption._attach_market_data
+    monkeypatch.setattr(
+        AmericanOption, "_attach_market_data", lambda self: attaches.append(self) or attach(self)
+    )
+    portfolio.scenario_analysis(np.array([90.0, 110.0]), np.array([0.2, 0.3]))
+
+    # One market switch per option per scenario, then one to restore it
+    assert len(attaches) == (4 + 1) * len(portfolio.positions)
+    for pos, price in zip(portfolio.positions, before):
+        assert (pos.option.spot_price, pos.option.volatility) == (100.0, 0.25)
+        assert pos.option.price() == price
+
+
+@pytest.mark.parametrize("spot, rate, dividend, vol, option_type", _PAST_THRESHOLD)
+def test_deep_moneyness_shortcut_matches_engine(spot, rate, dividend, vol, option_type):
+    option = AmericanOption(
+        spot, 100.0, _ONE_YEAR, vol, rate, dividend, option_type, valuation_date=_TODAY
+    )
+    assert option._deep_moneyness_bound() is not None
+    assert option.price() == pytest.approx(option.option.NPV(), abs=1e-6 * max(spot, 100.0))
+    assert option.delta() == pytest.approx(option.option.delta(), abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "spot, rate, dividend, vol, option_type",
+    [
+        # Inside the thresholds above
+        (_spot_at(-_DEEP + 0.01, 100.0, 0.05, 0.02, 0.3, 0.5), 0.05, 0.02, 0.3, "call"),
+        (_spot_at(_DEEP - 0.01, 100.0, 0.05, 0.0, 0.1, -0.5), 0.05, 0.0, 0.1, "call"),
+        (_perpetual_boundary(100.0, 0.05, 0.02, 0.25, False) * 1.001, 0.05, 0.02, 0.25, "put"),
+    ],
+)
+def test_model_used_short_of_the_thresholds(spot, rate, dividend, vol, option_type):
+    option = AmericanOption(
+        spot, 100.0, _ONE_YEAR, vol, rate, dividend, option_type, valuation_date=_TODAY
+    )
+    assert option._deep_moneyness_bound() is None
+    assert option.price() == option.option.NPV()
+    assert option.delta() == option.option.delta()
+
+
+def test_deep_in_the_money_dividend_call_keeps_its_premium():
+    """Regression: this call was pinned to intrinsic, 40 and delta 1."""
+    option = AmericanOption(100.0, 60.0, _ONE_YEAR, 0.1, 0.05, 0.03, "call", valuation_date=_TODAY)
+    assert option.price() == pytest.approx(40.0116, abs=1e-4)
+    assert option.delta() == pytest.approx(0.9797, abs=1e-4)
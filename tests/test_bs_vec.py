@@ -0,0 +1,226 @@
+"""Tests for the vectorized Bjerksund-Stensland kernel against QuantLib."""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+import QuantLib as ql  # type: ignore
+
+from deltadewa._bs_vec import (
+    bjerksund_stensland_greeks,
+    bjerksund_stensland_price,
+    portfolio_greeks,
+    price_chain,
+)
+
+_TODAY = ql.Date(15, 10, 2026)
+_ACT365 = ql.Actual365Fixed()
+
+
+def _process(spot, rate, dividend, vol):
+    return ql.BlackScholesMertonProcess(
+        ql.QuoteHandle(ql.SimpleQuote(spot)),
+        ql.YieldTermStructureHandle(ql.FlatForward(_TODAY, dividend, _ACT365)),
+        ql.YieldTermStructureHandle(ql.FlatForward(_TODAY, rate, _ACT365)),
+        ql.BlackVolTermStructureHandle(
+            ql.BlackConstantVol(_TODAY, ql.NullCalendar(), vol, _ACT365)
+        ),
+    )
+
+
+def _ql_price(spot, strike, days, rate, dividend, vol, is_call, european=False):
+    """QuantLib Bjerksund-Stensland (or analytic European) price."""
+    ql.Settings.instance().evaluationDate = _TODAY
+    payoff = ql.PlainVanillaPayoff(ql.Option.Call if is_call else ql.Option.Put, strike)
+    process = _process(spot, rate, dividend, vol)
+    if european:
+        option = ql.VanillaOption(payoff, ql.EuropeanExercise(_TODAY + days))
+        option.setPricingEngine(ql.AnalyticEuropeanEngine(process))
+    else:
+        option = ql.VanillaOption(payoff, ql.AmericanExercise(_TODAY, _TODAY + days))
+        option.setPricingEngine(ql.BjerksundStenslandApproximationEngine(process))
+    return option.NPV()
+
+
+def _kernel_price(spot, strike, days, rate, dividend, vol, is_call):
+    return float(
+        bjerksund_stensland_price(spot, strike, days / 365.0, rate, dividend, vol, is_call)
+    )
+
+
+@pytest.mark.parametrize(
+    "rate, dividend, vol, is_call",
+    [
+        (-0.01, 0.0, 0.1, True),
+        (-0.01, 0.0, 0.2, True),
+        (-0.03, 0.0, 0.2, True),
+        (0.0, -0.02, 0.1, False),
+        (0.0, -0.02, 0.15, False),
+    ],
+)
+@pytest.mark.parametrize("days", [30, 90, 365])
+@pytest.mark.parametrize("spot", [90.0, 100.0, 110.0])
+def test_negative_rates_keep_early_exercise(spot, days, rate, dividend, vol, is_call):
+    """Calls at r < 0 with q = 0 and puts at q < 0 with r = 0 are not European."""
+    kernel = _kernel_price(spot, 95.0, days, rate, dividend, vol, is_call)
+    assert kernel == pytest.approx(
+        _ql_price(spot, 95.0, days, rate, dividend, vol, is_call), abs=1e-9
+    )
+    european = _ql_price(spot, 95.0, days, rate, dividend, vol, is_call, european=True)
+    assert kernel >= european - 1e-9
+
+
+def test_negative_rate_call_has_early_exercise_premium():
+    """Regression: calls at r < 0 used to be priced as European."""
+    kernel = _kernel_price(100.0, 95.0, 365, -0.03, 0.0, 0.2, True)
+    european = _ql_price(100.0, 95.0, 365, -0.03, 0.0, 0.2, True, european=True)
+    assert kernel == pytest.approx(_ql_price(100.0, 95.0, 365, -0.03, 0.0, 0.2, True), abs=1e-9)
+    assert kernel - european > 0.1
+
+
+@pytest.mark.parametrize("rate, dividend, is_call", [(-0.01, -0.02, True), (-0.02, -0.01, False)])
+def test_negative_rates_european_when_carry_is_free(rate, dividend, is_call):
+    """Early exercise is never optimal when q <= min(r, 0) (calls) or r <= min(q, 0) (puts)."""
+    kernel = _kernel_price(100.0, 95.0, 180, rate, dividend, 0.25, is_call)
+    assert kernel == pytest.approx(_ql_price(100.0, 95.0, 180, rate, dividend, 0.25, is_call))
+    assert kernel == pytest.approx(
+        _ql_price(100.0, 95.0, 180, rate, dividend, 0.25, is_call, european=True)
+    )
+
+
+def test_negative_rate_without_flat_boundary_floors_at_european():
+    """Where the flat-boundary exponent has no real root the European value is returned."""
+    kernel = _kernel_price(100.0, 95.0, 180, -0.01, 0.0, 0.4, True)
+    assert math.isfinite(kernel)
+    european = _ql_price(100.0, 95.0, 180, -0.01, 0.0, 0.4, True, european=True)
+    assert kernel == pytest.approx(european)
+    assert np.isfinite(
+        bjerksund_stensland_price(100.0, 95.0, 0.5, -0.01, 0.0, [0.3, 0.4], True)
+    ).all()
+
+
+# Calls and puts, negative/zero/positive rates and dividends, deep OTM to deep
+# ITM spots against K=100, from one day to a year
+_GRID = list(
+    itertools.product(
+        (-0.02, 0.0, 0.05),
+        (-0.01, 0.0, 0.03),
+        (True, False),
+        (20.0, 60.0, 95.0, 100.0, 130.0, 400.0),
+        (1, 30, 365),
+        (0.1, 0.3),
+    )
+)
+
+
+def test_price_matches_quantlib_over_grid():
+    rate, dividend, is_call, spot, days, vol = (np.array(column) for column in zip(*_GRID))
+    kernel = bjerksund_stensland_price(spot, 100.0, days / 365.0, rate, dividend, vol, is_call)
+
+    compared = 0
+    for point, price in zip(_GRID, kernel):
+        r, q, call, s, d, v = point
+        try:
+            expected = _ql_price(s, 100.0, d, r, q, v, call)
+        except RuntimeError:
+            # QuantLib rejects the double-boundary case (r < q < 0 for calls)
+            expected = math.nan
+        if math.isnan(expected):
+            # QuantLib has no flat-boundary value at these negative rates; the
+            # kernel must still give a finite price above both lower bounds
+            european = _ql_price(s, 100.0, d, r, q, v, call, european=True)
+            intrinsic = max(s - 100.0 if call else 100.0 - s, 0.0)
+            assert math.isfinite(price), point
+            assert price >= max(european, intrinsic) - 1e-9, point
+            continue
+        assert price == pytest.approx(expected, rel=1e-9, abs=1e-9), point
+        compared += 1
+    assert compared > 500
+
+
+def test_expired_options_are_worth_intrinsic():
+    spots = np.array([80.0, 100.0, 120.0])
+    for T in (0.0, -0.01):
+        calls = bjerksund_stensland_price(spots, 100.0, T, 0.05, 0.02, 0.3, True)
+        puts = bjerksund_stensland_price(spots, 100.0, T, 0.05, 0.02, 0.3, False)
+        np.testing.assert_array_equal(calls, [0.0, 0.0, 20.0])
+        np.testing.assert_array_equal(puts, [20.0, 0.0, 0.0])
+
+
+def test_float32_prices_close_to_float64():
+    spots = np.linspace(50.0, 150.0, 101)
+    exact = bjerksund_stensland_price(spots, 100.0, 0.5, 0.05, 0.02, 0.25, False)
+    single = bjerksund_stensland_price(spots, 100.0, 0.5, 0.05, 0.02, 0.25, False, np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, exact, atol=1e-3)
+
+
+@pytest.mark.parametrize(
+    "rate, dividend, vol, is_call",
+    [
+        (0.05, 0.02, 0.25, True),
+        (0.05, 0.02, 0.25, False),
+        (0.03, 0.0, 0.25, True),
+        (-0.01, 0.0, 0.1, True),
+    ],
+)
+@pytest.mark.parametrize("spot", [70.0, 100.0, 140.0])
+def test_greeks_match_quantlib_bump_and_reprice(spot, rate, dividend, vol, is_call):
+    """Same bumps as AmericanOption: 0.01 spot, 1% vol and rate, one day."""
+
+    def price(s=spot, d=180, r=rate, v=vol):
+        return _ql_price(s, 100.0, d, r, dividend, v, is_call)
+
+    greeks = bjerksund_stensland_greeks(spot, 100.0, 180 / 365.0, rate, dividend, vol, is_call)
+    expected = {
+        "price": price(),
+        "delta": (price(s=spot + 0.01) - price(s=spot - 0.01)) / 0.02,
+        "gamma": (price(s=spot + 0.01) - 2 * price() + price(s=spot - 0.01)) / 1e-4,
+        "vega": (price(v=vol + 0.01) - price(v=vol - 0.01)) / 2.0,
+        "theta": (price(d=179) - price(d=181)) / 2.0,
+        "rho": (price(r=rate + 0.01) - price(r=rate - 0.01)) / 2.0,
+    }
+    for name, value in expected.items():
+        tolerance = 1e-5 if name == "gamma" else 1e-8
+        assert float(greeks[name]) == pytest.approx(value, abs=tolerance), name
+
+
+def test_greeks_subset_matches_full_and_keeps_order():
+    args = (np.array([90.0, 110.0]), 100.0, 0.5, 0.05, 0.02, 0.3, np.array([True, False]))
+    full = bjerksund_stensland_greeks(*args)
+    subset = bjerksund_stensland_greeks(*args, measures=("gamma", "price"))
+    assert list(subset) == ["gamma", "price"]
+    for name, values in subset.items():
+        np.testing.assert_array_equal(values, full[name])
+
+
+def test_price_chain():
+    strikes = np.array([90.0, 100.0, 110.0])
+    chain = price_chain(100.0, strikes, 0.5, 0.05, 0.02, 0.25, "PUT")
+    greeks = bjerksund_stensland_greeks(100.0, strikes, 0.5, 0.05, 0.02, 0.25, False)
+    for name, values in greeks.items():
+        np.testing.assert_array_equal(chain[name], values)
+    with pytest.raises(ValueError):
+        price_chain(100.0, strikes, 0.5, 0.05, 0.02, 0.25, "straddle")
+
+
+def test_portfolio_greeks_sums_positions_over_a_stress_grid():
+    strikes = np.array([90.0, 100.0, 110.0])
+    maturities = np.array([0.25, 0.5, 1.0])
+    is_call = np.array([False, True, True])
+    scale = np.array([100.0, -200.0, 100.0])
+    spots = np.linspace(80.0, 120.0, 5)
+    vols = np.array([0.15, 0.3])
+
+    totals = portfolio_greeks(
+        spots[:, None, None], strikes, maturities, 0.05, 0.01, vols[None, :, None], is_call, scale
+    )
+    for name, values in totals.items():
+        assert values.shape == (5, 2)
+        for i, spot in enumerate(spots):
+            for j, vol in enumerate(vols):
+                per_position = bjerksund_stensland_greeks(
+                    spot, strikes, maturities, 0.05, 0.01, vol, is_call, (name,)
+                )[name]
+                assert values[i, j] == pytest.approx(per_position @ scale, rel=1e-12, abs=1e-9)
@@ -0,0 +1,71 @@
+"""Tests for the opt-in persistent price cache."""
+
+from datetime import datetime
+
+import pytest
+
+from deltadewa import AmericanOption, _disk_cache
+
+_TODAY = datetime(2026, 10, 15)
+_EXPIRY = datetime(2027, 3, 19)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    AmericanOption.enable_disk_cache(str(tmp_path / "prices"))
+    yield tmp_path / "prices"
+    AmericanOption.disable_disk_cache()
+
+
+@pytest.fixture
+def npv_calls(monkeypatch):
+    """Count engine solves across every QuantLib option."""
+    calls = []
+    option_class = type(_option().option)
+    npv = option_class.NPV
+    monkeypatch.setattr(option_class, "NPV", lambda self: calls.append(self) or npv(self))
+    return calls
+
+
+def _option(engine="fd"):
+    return AmericanOption(
+        100.0, 95.0, _EXPIRY, 0.25, 0.05, 0.02, "put", valuation_date=_TODAY, engine=engine
+    )
+
+
+def test_hit_skips_the_engine(cache, npv_calls):
+    price = _option().price()
+    assert len(npv_calls) == 1
+    assert _disk_cache.get(_option()._disk_cache_key()) == price
+
+    assert _option().price() == price
+    assert len(npv_calls) == 1
+
+
+def test_hit_returns_the_stored_price(cache):
+    option = _option()
+    _disk_cache.put(option._disk_cache_key(), 1.5)
+    assert option.price() == 1.5
+
+
+def test_prices_persist_across_reopen(cache, npv_calls):
+    price = _option().price()
+    AmericanOption.disable_disk_cache()
+    AmericanOption.enable_disk_cache(str(cache))
+
+    assert _option().price() == price
+    assert len(npv_calls) == 1
+
+
+def test_clear_forgets_prices(cache, npv_calls):
+    _option().price()
+    AmericanOption.clear_cache()
+    _option().price()
+    assert len(npv_calls) == 2
+
+
+def test_approximation_engine_is_not_cached(cache, npv_calls):
+    option = _option(engine="quantlib")
+    option.price()
+    assert _disk_cache.get(option._disk_cache_key()) is None
+    assert len(npv_calls) == 1
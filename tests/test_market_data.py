@@ -0,0 +1,104 @@
+"""Tests for pooled market data and the per-option result cache."""
+
+import gc
+from datetime import datetime
+
+import pytest
+
+from deltadewa import AmericanOption, MarketDataPool
+
+_TODAY = datetime(2026, 10, 15)
+_EXPIRY = datetime(2027, 6, 18)
+
+
+def _option(pool=None, strike=100.0, option_type="put", engine="quantlib", **market):
+    inputs = {"spot_price": 100.0, "volatility": 0.25, "risk_free_rate": 0.05}
+    inputs.update(market)
+    return AmericanOption(
+        strike_price=strike,
+        maturity_date=_EXPIRY,
+        dividend_yield=0.02,
+        option_type=option_type,
+        valuation_date=_TODAY,
+        engine=engine,
+        pool=pool,
+        **inputs,
+    )
+
+
+def test_options_with_same_inputs_share_one_entry():
+    pool = MarketDataPool()
+    put = _option(pool, strike=95.0, option_type="put")
+    call = _option(pool, strike=105.0, option_type="call")
+
+    assert len(pool) == 1
+    assert put.market_data is call.market_data
+    assert put.bsm_process is call.bsm_process
+
+    other = _option(pool, spot_price=101.0)
+    assert len(pool) == 2
+    assert other.market_data is not put.market_data
+
+
+def test_spot_change_reuses_curves():
+    pool = MarketDataPool()
+    option = _option(pool)
+    before = option.market_data
+
+    option.update_spot_price(105.0)
+    assert option.market_data is not before
+    assert option.market_data._curves is before._curves
+    assert option.market_data.flat_ts is before.flat_ts
+    assert option.spot_quote.value() == 105.0
+
+    # Rates and volatility are part of the curves, so those build new ones
+    option.update_volatility(0.3)
+    assert option.market_data._curves is not before._curves
+
+
+def test_entries_dropped_once_unused():
+    pool = MarketDataPool()
+    first = _option(pool)
+    second = _option(pool)
+    assert len(pool) == 1
+
+    # An entry stays while any option still points at it
+    first.update_spot_price(110.0)
+    gc.collect()
+    assert len(pool) == 2
+    second.update_spot_price(110.0)
+    gc.collect()
+    assert len(pool) == 1
+
+    del first, second
+    gc.collect()
+    assert len(pool) == 0
+    assert len(pool._curves) == 0
+
+
+@pytest.mark.parametrize("engine", ["quantlib", "numpy"])
+def test_update_market_data_invalidates_cached_results(engine):
+    pool = MarketDataPool()
+    option = _option(pool, engine=engine)
+    price, greeks = option.price(), option.greeks()
+
+    option.update_market_data(spot_price=90.0, volatility=0.3)
+    expected = _option(engine=engine, spot_price=90.0, volatility=0.3)
+    assert option.price() == pytest.approx(expected.price(), abs=1e-12)
+    assert option.greeks() == pytest.approx(expected.greeks(), abs=1e-12)
+    assert option.price() != price
+    assert option.greeks()["delta"] != greeks["delta"]
+
+    # Restoring the inputs gives the original results back
+    option.update_market_data(spot_price=100.0, volatility=0.25)
+    assert option.price() == pytest.approx(price, abs=1e-12)
+    assert option.greeks() == pytest.approx(greeks, abs=1e-12)
+
+
+def test_direct_attribute_edit_invalidates_cached_results():
+    """The cache is keyed on the market inputs, not on update calls."""
+    option = _option(engine="numpy")
+    price = option.price()
+    option.spot_price = 90.0
+    assert option.price() != price
+    assert option.price() == pytest.approx(_option(engine="numpy", spot_price=90.0).price())
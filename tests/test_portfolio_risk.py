@@ -0,0 +1,138 @@
+"""Tests for the expiry risk measures of OptionPortfolio."""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from deltadewa import OptionPortfolio
+
+_TODAY = datetime(2026, 10, 15)
+_EXPIRY = datetime(2027, 3, 19)
+
+
+def _portfolio(legs, underlying_quantity=0.0):
+    """Portfolio at spot 100 holding (strike, quantity, option_type) legs."""
+    portfolio = OptionPortfolio(
+        underlying_quantity=underlying_quantity,
+        spot_price=100.0,
+        volatility=0.25,
+        risk_free_rate=0.05,
+        dividend_yield=0.02,
+        valuation_date=_TODAY,
+        seed=1,
+    )
+    for strike, quantity, option_type in legs:
+        portfolio.add_position(strike, _EXPIRY, quantity, option_type)
+    return portfolio
+
+
+def test_long_straddle_breakevens_at_strike_plus_minus_premium():
+    portfolio = _portfolio([(100.0, 1, "call"), (100.0, 1, "put")])
+    premium = portfolio.total_value() / 100.0
+
+    breakevens = portfolio.calculate_breakeven_points()
+    assert breakevens == pytest.approx([100.0 - premium, 100.0 + premium], rel=1e-12)
+    assert portfolio.calculate_max_profit_options()["is_unlimited"]
+    assert not portfolio.calculate_max_loss_options()["is_unlimited"]
+
+
+def test_call_spread_is_bounded_both_ways():
+    portfolio = _portfolio([(95.0, 1, "call"), (105.0, -1, "call")])
+    net_debit = portfolio.calculate_net_debit()
+
+    max_loss = portfolio.calculate_max_loss_options()
+    max_profit = portfolio.calculate_max_profit_options()
+    assert not max_loss["is_unlimited"]
+    assert not max_profit["is_unlimited"]
+    assert max_loss["max_loss"] == pytest.approx(-net_debit)
+    assert max_profit["max_profit"] == pytest.approx(1000.0 - net_debit)
+    assert len(portfolio.calculate_breakeven_points()) == 1
+
+
+def test_naked_short_call_has_unlimited_loss():
+    portfolio = _portfolio([(105.0, -1, "call")])
+
+    max_loss = portfolio.calculate_max_loss_options()
+    assert max_loss["is_unlimited"]
+    assert max_loss["max_loss"] == -math.inf
+    assert max_loss["spot_at_max_loss"] == math.inf
+    max_profit = portfolio.calculate_max_profit_options()
+    assert not max_profit["is_unlimited"]
+    assert max_profit["max_profit"] == pytest.approx(-portfolio.total_value())
+
+
+def test_short_put_is_bounded():
+    portfolio = _portfolio([(95.0, -1, "put")])
+    premium = -portfolio.total_value()
+
+    max_loss = portfolio.calculate_max_loss_options()
+    assert not max_loss["is_unlimited"]
+    assert math.isfinite(max_loss["max_loss"])
+    assert max_loss["max_loss"] < 0.0
+    # Spot cannot fall below zero, so the loss can never exceed the strike
+    assert max_loss["max_loss"] > -95.0 * 100 + premium - 1e-9
+    max_profit = portfolio.calculate_max_profit_options()
+    assert not max_profit["is_unlimited"]
+    assert max_profit["max_profit"] == pytest.approx(premium)
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_butterfly_extremes_are_exact_at_the_body_strike(direction):
+    """The body strike, 101.3, falls between the samples of a 200-point grid."""
+    legs = [(95.0, direction, "call"), (101.3, -2 * direction, "call"), (107.6, direction, "call")]
+    portfolio = _portfolio(legs)
+    net_debit = portfolio.calculate_net_debit()
+    peak = direction * 6.3 * 100 - net_debit
+
+    if direction > 0:
+        extreme = portfolio.calculate_max_profit_options()
+        assert extreme["max_profit"] == pytest.approx(peak, rel=1e-12)
+        assert extreme["spot_at_max_profit"] == 101.3
+        assert portfolio.calculate_max_loss_options()["max_loss"] == pytest.approx(-net_debit)
+    else:
+        extreme = portfolio.calculate_max_loss_options()
+        assert extreme["max_loss"] == pytest.approx(peak, rel=1e-12)
+        assert extreme["spot_at_max_loss"] == 101.3
+        assert portfolio.calculate_max_profit_options()["max_profit"] == pytest.approx(-net_debit)
+
+    # A given range is still only sampled
+    grid = np.linspace(50.0, 200.0, 200)
+    sampled = portfolio.calculate_max_profit_total(grid)["max_profit"]
+    assert sampled == pytest.approx(portfolio.calculate_pnl_at_expiry_vec(grid).max())
+
+
+def test_underlying_changes_total_upside():
+    # Covered call: the long shares cap the short call's loss
+    covered = _portfolio([(105.0, -1, "call")], underlying_quantity=100)
+    assert not covered.calculate_max_loss_total()["is_unlimited"]
+    assert not covered.calculate_max_profit_total()["is_unlimited"]
+
+    # Short shares against a short put lose without bound as spot rises
+    short = _portfolio([(95.0, -1, "put")], underlying_quantity=-100)
+    assert short.calculate_max_loss_total()["is_unlimited"]
+    assert not short.calculate_max_loss_options()["is_unlimited"]
+
+
+@pytest.mark.parametrize(
+    "legs, underlying_quantity",
+    [
+        ([(100.0, 1, "call"), (100.0, 1, "put")], 0.0),
+        ([(95.0, 1, "call"), (105.0, -1, "call")], 0.0),
+        ([(105.0, -1, "call")], 100),
+        ([(95.0, -1, "put")], -100),
+    ],
+)
+def test_risk_reward_analysis_matches_individual_measures(legs, underlying_quantity):
+    portfolio = _portfolio(legs, underlying_quantity)
+    analysis = portfolio.risk_reward_analysis()
+
+    assert analysis["max_loss_options"] == portfolio.calculate_max_loss_options()
+    assert analysis["max_profit_options"] == portfolio.calculate_max_profit_options()
+    assert analysis["max_loss_total"] == portfolio.calculate_max_loss_total()
+    assert analysis["max_profit_total"] == portfolio.calculate_max_profit_total()
+    assert analysis["breakeven_options"] == pytest.approx(portfolio.calculate_breakeven_points())
+    assert analysis["breakeven_total"] == pytest.approx(
+        portfolio.calculate_breakeven_points(include_underlying=True)
+    )